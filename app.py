@@ -1,28 +1,240 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request
 import pandas as pd
-import plotly.graph_objs as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import numpy as np
+import json
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is an optional accelerator; the NumPy fallback below is used
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional accelerator; stdlib json is used if missing
+    orjson = None
+
+def _json_default(value):
+    """Fallback converter for types stdlib json can't serialize"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+def _dumps_json(obj):
+    """Serialize to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+    # allow_nan=False so a stray NaN fails loudly here instead of
+    # shipping bytes that JSON.parse rejects
+    return json.dumps(obj, default=_json_default, allow_nan=False).encode()
 
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (walks numpy arrays in C)"""
+
+        def dumps(self, obj, **kwargs):
+            return _dumps_json(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 data_dir = 'finance_dashboard_data'
 tickers = ['SPY', 'AAPL', 'NVDA', 'TSLA', 'MSFT']
 
-def load_data():
-    data = {}
-    for ticker in tickers:
-        path = os.path.join(data_dir, f"{ticker}.csv")
-        df = pd.read_csv(path)
-        # Ensure Date column is properly converted to datetime
+def _load_one(ticker):
+    csv_path = os.path.join(data_dir, f"{ticker}.csv")
+    parquet_path = os.path.join(data_dir, f"{ticker}.parquet")
+    if os.path.exists(parquet_path):
+        # Parquet is columnar and typed, so loading skips the CSV
+        # string parsing entirely
+        df = pd.read_parquet(parquet_path, columns=['Close', 'Volume'])
+        # Caches written before the downcast hold float64/int64; this is
+        # a no-op when the file is already narrow
+        df = df.astype({'Close': 'float32', 'Volume': 'int32'})
+    else:
+        # Only Date/Close/Volume are ever read; skipping the OHLC and
+        # Adj Close columns halves the bytes scanned by every filter
+        df = pd.read_csv(csv_path, usecols=['Date', 'Close', 'Volume'])
+        # Sorted DatetimeIndex so date-range filtering is an index slice
         df['Date'] = pd.to_datetime(df['Date'])
-        data[ticker] = df
-    return data
+        df = df.sort_values('Date').set_index('Date')
+        # float32 prices / int32 volumes halve the bytes every filter
+        # scans with no precision the dashboard cares about
+        df = df.astype({'Close': 'float32', 'Volume': 'int32'})
+        df.to_parquet(parquet_path, engine='pyarrow', compression='snappy')
+    # Volume change percentage from previous day, precomputed once
+    # for the API payload
+    df['Volume_Change_Pct'] = (df['Volume'].pct_change() * 100).astype('float32')
+    # Date strings formatted once at load so no request path pays a
+    # per-row Timestamp -> str conversion
+    df['DateStr'] = df.index.strftime('%Y-%m-%d')
+    return ticker, df
 
+def load_data():
+    # The parquet/CSV readers release the GIL during I/O and parsing,
+    # so loading the tickers in parallel cuts cold-start time
+    with ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+        return dict(executor.map(_load_one, tickers))
+
+# Loaded once at import time. Under "gunicorn -w N --preload app:app" the
+# dataset is materialized in the master before forking, so copy-on-write
+# shares a single copy across workers: nothing below ever writes into
+# these frames (all per-ticker columns are assigned in _load_one before
+# the dict is published, and the request path only slices/masks).
 data = load_data()
 
+def _compute_global_bounds(data):
+    """Global date/volume/price bounds for the filter defaults.
+
+    Computed once at load with vectorized Series reductions instead of
+    rebuilding Python lists over every row on each request.
+    """
+    return {
+        'min_date': min(df.index.min() for df in data.values()).strftime('%Y-%m-%d'),
+        'max_date': max(df.index.max() for df in data.values()).strftime('%Y-%m-%d'),
+        'min_vol': min(df['Volume'].min() for df in data.values()),
+        'max_vol': max(df['Volume'].max() for df in data.values()),
+        'min_price': min(df['Close'].min() for df in data.values()),
+        'max_price': max(df['Close'].max() for df in data.values()),
+    }
+
+GLOBAL_BOUNDS = _compute_global_bounds(data)
+
+# Raw datetime64 arrays per ticker for binary-search date slicing
+DATE_VALUES = {ticker: df.index.to_numpy() for ticker, df in data.items()}
+
+def _volume_increase_mask(vol, threshold):
+    """Mask of days whose volume rose at least threshold % over the previous day"""
+    out = np.zeros(vol.size, np.bool_)
+    out[1:] = (vol[1:] - vol[:-1]) / vol[:-1] * 100.0 >= threshold
+    return out
+
+if njit is not None:
+    # Fuse the pct-change and threshold compare into one JIT-compiled loop
+    @njit(cache=True)
+    def _volume_increase_mask(vol, threshold):
+        out = np.zeros(vol.size, np.bool_)
+        for i in range(1, vol.size):
+            out[i] = (vol[i] - vol[i - 1]) / vol[i - 1] * 100.0 >= threshold
+        return out
+
+def _filter_data(ticker, start_date, end_date, min_volume, max_volume,
+                 min_price, max_price, volume_increase_threshold):
+    """Apply the request filters to a ticker's data, returning None if empty"""
+    if ticker not in data:
+        print(f"Ticker {ticker} not found in data")
+        return None
+
+    # No copy needed: the filters below only read, and slicing/masking
+    # already produces new frames
+    df = data[ticker]
+
+    # Date filtering - np.searchsorted over the cached sorted date array
+    # gives a contiguous positional slice without label-lookup overhead
+    if start_date or end_date:
+        dates = DATE_VALUES[ticker]
+        lo = np.searchsorted(dates, np.datetime64(start_date), side='left') if start_date else 0
+        hi = np.searchsorted(dates, np.datetime64(end_date), side='right') if end_date else len(dates)
+        df = df.iloc[lo:hi]
+
+    # Combine the remaining filters into one mask over raw NumPy arrays
+    # so the frame is materialized once instead of per condition
+    mask = np.ones(len(df), dtype=bool)
+
+    # Volume filtering - only apply if values are reasonable
+    if min_volume is not None and min_volume > 0:
+        mask &= df['Volume'].to_numpy() >= min_volume
+    if max_volume is not None and max_volume > 0:
+        mask &= df['Volume'].to_numpy() <= max_volume
+
+    # Price filtering - only apply if values are reasonable
+    if min_price is not None and min_price > 0:
+        mask &= df['Close'].to_numpy() >= min_price
+    if max_price is not None and max_price > 0:
+        mask &= df['Close'].to_numpy() <= max_price
+
+    # Volume increase filtering - one fused pass over the raw volumes
+    if volume_increase_threshold is not None and volume_increase_threshold > 0:
+        mask &= _volume_increase_mask(df['Volume'].to_numpy(np.float64),
+                                      volume_increase_threshold)
+
+    if not mask.all():
+        df = df[mask]
+
+    if volume_increase_threshold is not None and volume_increase_threshold > 0:
+        print(f"Volume increase filter: {volume_increase_threshold}% threshold, {len(df)} days found")
+
+    if df.empty:
+        print(f"No data found after filtering for {ticker}")
+        return None
+
+    print(f"Filtered data has {len(df)} rows for {ticker}")
+    return df
+
+@lru_cache(maxsize=256)
+def _build_chart_data(ticker, start_date, end_date, min_volume, max_volume,
+                      min_price, max_price, volume_increase_threshold):
+    """Build the raw chart arrays as JSON for one filter combination.
+
+    Cached so repeat requests with the same filters skip the pandas filtering
+    and serialization. Call cache_clear() if the data is reloaded. The client
+    builds the Plotly traces itself, so only the bare date/close/volume
+    arrays go over the wire instead of a rendered figure.
+    """
+    filtered_data = _filter_data(ticker, start_date, end_date, min_volume,
+                                 max_volume, min_price, max_price,
+                                 volume_increase_threshold)
+    if filtered_data is None:
+        return ""
+
+    return _dumps_json({
+        'ticker': ticker,
+        'x': filtered_data['DateStr'].tolist(),
+        'close': filtered_data['Close'].to_numpy(np.float64).round(2),
+        'volume': filtered_data['Volume'].to_numpy(np.float64)
+    }).decode()
+
+# Warm the chart cache for the unfiltered view of every ticker so the
+# dominant "first visit" path serves a precomputed string, and with
+# --preload the warmed cache is forked into every worker
+for _ticker in tickers:
+    _build_chart_data(_ticker, None, None, None, None, None, None, None)
+
+@lru_cache(maxsize=256)
+def _build_api_json(ticker, start_date, end_date, min_volume, max_volume,
+                    min_price, max_price, volume_increase_threshold):
+    """Build the serialized API response bytes, cached per filter combination.
+
+    Caching the final JSON rather than the records means repeat requests
+    skip the datetime serialization entirely. The payload is column-
+    oriented (one list per column) rather than one dict per row, which
+    avoids N*K per-row boxing and shrinks the JSON.
+    """
+    df = _filter_data(ticker, start_date, end_date, min_volume, max_volume,
+                      min_price, max_price, volume_increase_threshold)
+    if df is None:
+        return _dumps_json({})
+    return _dumps_json({
+        'Date': df['DateStr'].tolist(),
+        'Close': df['Close'].to_numpy(np.float64).round(2).tolist(),
+        'Volume': df['Volume'].tolist(),
+        # NaN (first row of pct_change) must become null, not a bare NaN
+        # token that strict JSON parsers reject
+        'Volume_Change_Pct': [None if np.isnan(v) else v
+                              for v in df['Volume_Change_Pct'].to_numpy(np.float64).round(4)],
+    })
+
 @app.route('/')
 def dashboard():
     # Get filter parameters from request
@@ -34,129 +246,19 @@ def dashboard():
     min_price = request.args.get('min_price', type=float)
     max_price = request.args.get('max_price', type=float)
     volume_increase_threshold = request.args.get('volume_increase_threshold', type=float)
-    
-    # Filter data based on parameters
-    filtered_data = None
-    if selected_ticker in data:
-        df = data[selected_ticker].copy()
-        
-        # Date filtering
-        if start_date:
-            df = df[df['Date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['Date'] <= pd.to_datetime(end_date)]
-        
-        # Volume filtering - only apply if values are reasonable
-        if min_volume is not None and min_volume > 0:
-            df = df[df['Volume'] >= min_volume]
-        if max_volume is not None and max_volume > 0:
-            df = df[df['Volume'] <= max_volume]
-        
-        # Price filtering - only apply if values are reasonable
-        if min_price is not None and min_price > 0:
-            df = df[df['Close'] >= min_price]
-        if max_price is not None and max_price > 0:
-            df = df[df['Close'] <= max_price]
-        
-        # Volume increase filtering
-        if volume_increase_threshold is not None and volume_increase_threshold > 0:
-            # Calculate volume change percentage from previous day
-            df = df.sort_values('Date')
-            df['Volume_Change_Pct'] = df['Volume'].pct_change() * 100
-            
-            # Filter for days with volume increase above threshold
-            df = df[df['Volume_Change_Pct'] >= volume_increase_threshold]
-            
-            print(f"Volume increase filter: {volume_increase_threshold}% threshold, {len(df)} days found")
-        
-        if not df.empty:
-            filtered_data = df
-            print(f"Filtered data has {len(filtered_data)} rows for {selected_ticker}")
-        else:
-            print(f"No data found after filtering for {selected_ticker}")
-    else:
-        print(f"Ticker {selected_ticker} not found in data")
-    
-    # Create price line chart
-    price_html = ""
-    if filtered_data is not None:
-        # Ensure we're using price data
-        price_data = filtered_data['Close'].astype(float)
-        
-        price_trace = go.Scatter(
-            x=filtered_data['Date'],
-            y=price_data,
-            mode='lines',
-            name=f'{selected_ticker} Price',
-            line=dict(color='#1f77b4', width=3)
-        )
-        
-        price_layout = go.Layout(
-            title=f'{selected_ticker} Stock Price Over Time',
-            xaxis=dict(title='Date'),
-            yaxis=dict(title='Price ($)', tickformat='$.2f'),  # Format as currency
-            hovermode='closest',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        price_fig = go.Figure(data=[price_trace], layout=price_layout)
-        price_html = price_fig.to_html(
-            full_html=False, 
-            config={'displayModeBar': False}
-        )
-
-    # Create volume line chart
-    volume_html = ""
-    if filtered_data is not None:
-        # Ensure we're using volume data and format it properly
-        volume_data = filtered_data['Volume'].astype(float)
-        
-        volume_trace = go.Scatter(
-            x=filtered_data['Date'],
-            y=volume_data,
-            mode='lines',
-            name=f'{selected_ticker} Volume',
-            line=dict(color='#1f77b4', width=2),
-            fill='tonexty',  # Add fill to make it more distinct
-            opacity=0.7
-        )
-        
-        volume_layout = go.Layout(
-            title=f'{selected_ticker} Trading Volume Over Time',
-            xaxis=dict(title='Date'),
-            yaxis=dict(title='Volume (shares)', tickformat=',d'),  # Format large numbers
-            hovermode='closest',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        volume_fig = go.Figure(data=[volume_trace], layout=volume_layout)
-        volume_html = volume_fig.to_html(
-            full_html=False, 
-            config={'displayModeBar': False}
-        )
-
-    # Get ranges for filter defaults
-    all_dates = []
-    all_volumes = []
-    all_prices = []
-    for df in data.values():
-        all_dates.extend(df['Date'].tolist())
-        all_volumes.extend(df['Volume'].tolist())
-        all_prices.extend(df['Close'].tolist())
-    
-    min_date = min(all_dates).strftime('%Y-%m-%d') if all_dates else ''
-    max_date = max(all_dates).strftime('%Y-%m-%d') if all_dates else ''
-    min_vol = min(all_volumes) if all_volumes else 0
-    max_vol = max(all_volumes) if all_volumes else 0
-    min_price_val = min(all_prices) if all_prices else 0
-    max_price_val = max(all_prices) if all_prices else 0
-
-    # Debug: Print actual data ranges
-    print(f"Data ranges - Price: {min_price_val:.2f} to {max_price_val:.2f}")
-    print(f"Data ranges - Volume: {min_vol:,} to {max_vol:,}")
-    print(f"Data ranges - Date: {min_date} to {max_date}")
+
+    chart_data = _build_chart_data(
+        selected_ticker, start_date, end_date, min_volume, max_volume,
+        min_price, max_price, volume_increase_threshold
+    )
+
+    # Ranges for filter defaults, precomputed at load
+    min_date = GLOBAL_BOUNDS['min_date']
+    max_date = GLOBAL_BOUNDS['max_date']
+    min_vol = GLOBAL_BOUNDS['min_vol']
+    max_vol = GLOBAL_BOUNDS['max_vol']
+    min_price_val = GLOBAL_BOUNDS['min_price']
+    max_price_val = GLOBAL_BOUNDS['max_price']
 
     # Use more reasonable default filter values
     default_min_price = min_price_val if min_price_val > 0 else 0
@@ -165,9 +267,8 @@ def dashboard():
     default_max_volume = max_vol if max_vol > 0 else 10000000
 
     return render_template(
-        'dashboard.html', 
-        price_html=price_html, 
-        volume_html=volume_html,
+        'dashboard.html',
+        chart_data=chart_data,
         tickers=tickers,
         selected_ticker=selected_ticker,
         min_date=min_date,
@@ -198,34 +299,13 @@ def api_data():
     min_price = request.args.get('min_price', type=float)
     max_price = request.args.get('max_price', type=float)
     volume_increase_threshold = request.args.get('volume_increase_threshold', type=float)
-    
-    filtered_data = {}
-    if selected_ticker in data:
-        df = data[selected_ticker].copy()
-        
-        if start_date:
-            df = df[df['Date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['Date'] <= pd.to_datetime(end_date)]
-        if min_volume is not None and min_volume > 0:
-            df = df[df['Volume'] >= min_volume]
-        if max_volume is not None and max_volume > 0:
-            df = df[df['Volume'] <= max_volume]
-        if min_price is not None and min_price > 0:
-            df = df[df['Close'] >= min_price]
-        if max_price is not None and max_price > 0:
-            df = df[df['Close'] <= max_price]
-        
-        # Volume increase filtering
-        if volume_increase_threshold is not None and volume_increase_threshold > 0:
-            df = df.sort_values('Date')
-            df['Volume_Change_Pct'] = df['Volume'].pct_change() * 100
-            df = df[df['Volume_Change_Pct'] >= volume_increase_threshold]
-        
-        if not df.empty:
-            filtered_data = df.to_dict('records')
-    
-    return jsonify(filtered_data)
+
+    response_bytes = _build_api_json(
+        selected_ticker, start_date, end_date, min_volume, max_volume,
+        min_price, max_price, volume_increase_threshold
+    )
+
+    return app.response_class(response_bytes, mimetype='application/json')
 
 if __name__ == '__main__':
     app.run(debug=True, port=5000, host='0.0.0.0')
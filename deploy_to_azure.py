@@ -66,27 +66,24 @@ def create_sample_data():
         tickers = ['SPY', 'AAPL', 'NVDA', 'TSLA', 'MSFT']
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)  # 30 days of data
-        date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-        date_range = date_range[date_range.weekday < 5]  # Weekdays only
-        
+        date_range = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days only
+
         for ticker in tickers:
             print(f"Creating sample data for {ticker}...")
-            
-            # Generate realistic sample data
+
+            # Generate realistic sample data as a vectorized random walk
             np.random.seed(hash(ticker) % 1000)
             base_price = {'SPY': 400, 'AAPL': 150, 'NVDA': 300, 'TSLA': 200, 'MSFT': 250}.get(ticker, 100)
-            
-            prices = [base_price]
-            for i in range(1, len(date_range)):
-                change = np.random.normal(0, 0.02)
-                new_price = prices[-1] * (1 + change)
-                prices.append(max(new_price, 1))
-            
+
+            changes = 1 + np.random.normal(0, 0.02, len(date_range))
+            changes[0] = 1
+            prices = np.maximum(base_price * np.cumprod(changes), 1)
+
             df = pd.DataFrame({
                 'Date': date_range,
                 'Open': prices,
-                'High': [p * 1.01 for p in prices],
-                'Low': [p * 0.99 for p in prices],
+                'High': prices * 1.01,
+                'Low': prices * 0.99,
                 'Close': prices,
                 'Adj Close': prices,
                 'Volume': np.random.randint(1000000, 10000000, len(date_range))
@@ -150,7 +147,7 @@ def main():
     print("1. Push your code to GitHub")
     print("2. Create an Azure Web App")
     print("3. Connect your GitHub repository")
-    print("4. Set startup command: python app.py")
+    print("4. Set startup command: gunicorn --workers 4 --preload --bind 0.0.0.0:8000 app:app")
     print("5. Deploy!")
     
     print("\n📚 For detailed instructions, see README.md")